@@ -7,7 +7,7 @@ that start with a specified prefix. It performs the following checks and actions
 
 1. Check if any VMs are attached to the VG (skips the VG unless --force is used)
 2. Remove any disks within the VG
-3. Delete the VG
+3. Delete all processed VGs together, in chunks of acli script invocations
 
 Options:
 --dry-run: Show what would be deleted without actually making changes
@@ -15,13 +15,24 @@ Options:
 --verbose: Enable more detailed logging
 --prefix: Specify the VG name prefix to match (REQUIRED)
 --timeout: Set command timeout in seconds (default: 30)
+--parallel: Number of VGs to process in parallel (default: 8)
+--max-concurrent-acli: Maximum number of acli commands running at once (default: 16)
+--session: Reuse one persistent acli process per worker instead of one per command
+           (--parallel is capped at --max-concurrent-acli)
 """
 
 import subprocess
 import argparse
 import sys
 import re
+import shlex
 import logging
+import os
+import select
+import time
+from collections import namedtuple
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Set up logging
 logging.basicConfig(
@@ -33,106 +44,570 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def run_acli_command(command, dry_run=False, timeout=30, confirm=False):
+# Patterns used to parse single lines of 'acli vg.get' output, compiled once at import time
+_ATTACH_TYPE_RE = re.compile(r'volume_group_attachment_type: "([^"]+)"')
+_VM_UUID_RE = re.compile(r'vm_uuid:\s*"([^"]+)"')
+_DISK_INDEX_RE = re.compile(r'index: (\d+)')
+
+# Details parsed from 'acli vg.get' output
+VGInfo = namedtuple("VGInfo", ["attachment_type", "vm_uuids", "disk_indexes"])
+
+# Number of vg.delete commands sent to each acli script process
+_VG_DELETE_CHUNK_SIZE = 50
+
+# Characters that are special in a grep extended regular expression
+_ERE_SPECIAL_RE = re.compile(r'([.^$*+?()\[\]{}|\\])')
+
+def build_acli_argv(command):
     """
-    Execute an ACLI command via subprocess
+    Build the argument list for an ACLI command
     
     Args:
         command (str): The ACLI command to run
+        
+    Returns:
+        list: The acli argument list, executed directly without a shell
+    """
+    return ["acli"] + shlex.split(command)
+
+def run_process(argv, dry_run=False, timeout=30, confirm=False, line_filter=None, grep_pattern=None,
+                stdin_text=None):
+    """
+    Execute a command via subprocess without an intermediate shell
+    
+    Args:
+        argv (list): The command and its arguments
         dry_run (bool): If True, only print the command without executing
         timeout (int): Maximum time to wait for command completion in seconds
-        confirm (bool): Whether to auto-confirm any prompts with 'yes'
+        confirm (bool): Whether to auto-confirm any prompts with 'yes' on stdin
+        line_filter (callable): If given, stdout is streamed line by line through
+            this function and only its non-None results are kept
+        grep_pattern (str): If given together with line_filter, stdout is first
+            piped through 'grep -E grep_pattern'. grep finding no match is not
+            an error.
+        stdin_text (str): Text to write to the process's stdin, instead of the
+            'yes' written by confirm
         
     Returns:
-        str: Command output if executed, or a dry run message
+        str: Command output if executed, or a dry run message. When line_filter
+            is given, a list of the filtered results is returned instead.
     """
-    full_command = "acli {}".format(command)
+    if stdin_text is None and confirm:
+        stdin_text = "yes\n"
     
-    # Add echo yes pipe for commands that require confirmation
-    if confirm and not dry_run:
-        full_command = "echo yes | " + full_command
+    command_line = " ".join(shlex.quote(arg) for arg in argv)
+    if line_filter is not None and grep_pattern is not None:
+        command_line += " | grep -E {}".format(shlex.quote(grep_pattern))
     
     if dry_run:
-        logger.info("[DRY RUN] Would execute: {}".format(full_command))
+        logger.info("[DRY RUN] Would execute: {}".format(command_line))
         return "[DRY RUN] Command not executed"
     
-    try:
-        logger.info("Executing: {}".format(full_command))
-        # Using Popen instead of run for better compatibility with Python 3.6
-        process = subprocess.Popen(
-            full_command, 
-            shell=True, 
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True  # This is equivalent to text=True in Python 3.7+
-        )
+    # Cap the number of acli commands running at once across all worker threads
+    with _acli_slots:
+        try:
+            logger.info("Executing: {}".format(command_line))
+            # Using Popen instead of run for better compatibility with Python 3.6
+            process = subprocess.Popen(
+                argv,
+                stdin=subprocess.PIPE if stdin_text is not None else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True  # This is equivalent to text=True in Python 3.7+
+            )
+            
+            if line_filter is not None:
+                return _stream_output(process, timeout, line_filter, grep_pattern, stdin_text)
+            
+            # Set a timeout for command execution
+            try:
+                stdout, stderr = process.communicate(input=stdin_text, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                logger.warning("Command timed out after {} seconds, but continuing execution".format(timeout))
+                return "TIMEOUT"
+            
+            if process.returncode != 0:
+                logger.error("Command failed with return code: {}".format(process.returncode))
+                logger.error("Error output: {}".format(stderr))
+                return None
+            return stdout
+        except Exception as e:
+            logger.error("Command failed: {}".format(e))
+            return None
+
+def _stream_output(process, timeout, line_filter, grep_pattern=None, stdin_text=None):
+    """
+    Read a running process's stdout line by line, keeping only filtered results
+    
+    Only the filtered results are held in memory, rather than the whole output.
+    
+    Args:
+        process (subprocess.Popen): The running process
+        timeout (int): Maximum time to wait for command completion in seconds
+        line_filter (callable): Function applied to each line; None results are dropped
+        grep_pattern (str): If given, pipe the output through 'grep -E grep_pattern' first
+        stdin_text (str): Text to write to the process's stdin, if any
         
-        # Set a timeout for command execution
+    Returns:
+        list: Filtered results, "TIMEOUT" if the command timed out, or None on failure
+    """
+    if stdin_text is not None:
+        process.stdin.write(stdin_text)
+        process.stdin.close()
+    
+    grep = None
+    if grep_pattern is not None:
         try:
-            stdout, stderr = process.communicate(timeout=timeout)
-        except subprocess.TimeoutExpired:
+            grep = subprocess.Popen(
+                ["grep", "-E", grep_pattern],
+                stdin=process.stdout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True
+            )
+        except Exception:
             process.kill()
-            logger.warning("Command timed out after {} seconds, but continuing execution".format(timeout))
-            return "TIMEOUT"
+            process.wait()
+            raise
+        # Only grep reads acli's output now, so acli sees a broken pipe if grep exits
+        process.stdout.close()
+    reader = grep if grep is not None else process
+    
+    # communicate() cannot be used while streaming, so kill the processes from a timer
+    timed_out = threading.Event()
+    
+    def kill_on_timeout():
+        timed_out.set()
+        process.kill()
+        if grep is not None:
+            grep.kill()
+    
+    timer = threading.Timer(timeout, kill_on_timeout)
+    timer.start()
+    try:
+        results = []
+        for line in reader.stdout:
+            result = line_filter(line)
+            if result is not None:
+                results.append(result)
+        stderr = process.stderr.read()
+        process.wait()
+        if grep is not None:
+            grep_stderr = grep.stderr.read()
+            grep.wait()
+    finally:
+        timer.cancel()
+        reader.stdout.close()
+        process.stderr.close()
+        if grep is not None:
+            grep.stderr.close()
+    
+    if timed_out.is_set():
+        logger.warning("Command timed out after {} seconds, but continuing execution".format(timeout))
+        return "TIMEOUT"
+    
+    if process.returncode != 0:
+        logger.error("Command failed with return code: {}".format(process.returncode))
+        logger.error("Error output: {}".format(stderr))
+        return None
+    
+    # grep exits with 1 when nothing matches, which is not an error here
+    if grep is not None and grep.returncode > 1:
+        logger.error("grep failed with return code: {}".format(grep.returncode))
+        logger.error("Error output: {}".format(grep_stderr))
+        return None
+    return results
+
+class AcliSession(object):
+    """
+    A long-lived interactive acli process that commands are written to over stdin
+    
+    Reusing one process avoids paying the acli start-up cost for every
+    command. Responses are delimited by the acli prompt. The interactive
+    shell does not report an exit status per command, so only timeouts and
+    a dead process are detected as failures by the session itself. Disk and
+    VG deletions are still verified afterwards with vg.get and vg.list, but
+    failures of vg.detach_from_vm and vg.get are not detected.
+    """
+    PROMPT = "<acropolis> "
+    
+    # Matches a yes/no confirmation prompt at the end of the output read so far
+    CONFIRM_PROMPT_RE = re.compile(r'\(yes/no\)\s*$')
+    
+    def __init__(self, timeout=30):
+        """
+        Start the acli process and wait for its first prompt
+        
+        Args:
+            timeout (int): Maximum time to wait for the prompt in seconds
+        """
+        with _acli_slots:
+            self.process = subprocess.Popen(
+                ["acli"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT
+            )
+            self.alive = True
+            response = self._read_response(timeout)
+        if response in (None, "TIMEOUT"):
+            self.close()
+            raise RuntimeError("acli session did not show a prompt within {} seconds".format(timeout))
+    
+    def send(self, command, timeout=30, confirm=False):
+        """
+        Run one ACLI command in the session
         
-        if process.returncode != 0:
-            logger.error("Command failed with return code: {}".format(process.returncode))
-            logger.error("Error output: {}".format(stderr))
+        Args:
+            command (str): The ACLI command to run
+            timeout (int): Maximum time to wait for command completion in seconds
+            confirm (bool): Whether to answer 'yes' to a confirmation prompt
+            
+        Returns:
+            str: Command output, "TIMEOUT" if the command timed out, or None on failure
+        """
+        with _acli_slots:
+            output = self._run(command, timeout, confirm)
+        
+        if output == "TIMEOUT":
+            # The session state is unknown after a timeout, so do not reuse it
+            logger.warning("Command timed out after {} seconds, but continuing execution".format(timeout))
+            self.close()
+        elif output is None:
+            logger.error("acli session exited unexpectedly")
+            self.close()
+        return output
+    
+    def _run(self, command, timeout, confirm):
+        if not self._write(command):
             return None
-        return stdout
+        
+        output = self._read_response(timeout)
+        if output is not None and output != "TIMEOUT" and self.CONFIRM_PROMPT_RE.search(output):
+            if not self._write("yes" if confirm else "no"):
+                return None
+            rest = self._read_response(timeout)
+            if rest is None or rest == "TIMEOUT":
+                output = rest
+            else:
+                output += rest
+        return output
+    
+    def close(self):
+        """Stop the acli process"""
+        self.alive = False
+        try:
+            self.process.stdin.close()
+        except (OSError, ValueError):
+            pass
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process.stdout.close()
+    
+    def _write(self, line):
+        try:
+            self.process.stdin.write((line + "\n").encode())
+            self.process.stdin.flush()
+            return True
+        except (OSError, ValueError) as e:
+            logger.error("Failed to write to acli session: {}".format(e))
+            self.close()
+            return False
+    
+    def _read_response(self, timeout):
+        """
+        Read output until the acli prompt or a confirmation prompt
+        
+        Returns:
+            str: Output without the trailing acli prompt, "TIMEOUT", or None on EOF
+        """
+        deadline = time.monotonic() + timeout
+        fd = self.process.stdout.fileno()
+        data = b""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return "TIMEOUT"
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return "TIMEOUT"
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                return None
+            data += chunk
+            
+            text = data.decode(errors="replace")
+            if text.endswith(self.PROMPT):
+                return text[:-len(self.PROMPT)]
+            if self.CONFIRM_PROMPT_RE.search(text):
+                return text
+
+# Limits how many acli commands run at once, see set_max_concurrent_acli()
+_acli_slots = threading.BoundedSemaphore(16)
+
+def set_max_concurrent_acli(limit):
+    """
+    Set the maximum number of acli commands allowed to run at the same time
+    
+    Args:
+        limit (int): Maximum number of concurrent acli commands
+    """
+    global _acli_slots
+    _acli_slots = threading.BoundedSemaphore(limit)
+
+# Each worker thread keeps its own acli session, as a session handles one command at a time
+_use_acli_sessions = False
+_session_state = threading.local()
+_open_sessions = []
+_open_sessions_lock = threading.Lock()
+
+def enable_acli_sessions():
+    """Route ACLI commands through per-thread persistent acli sessions"""
+    global _use_acli_sessions
+    _use_acli_sessions = True
+
+def get_acli_session(timeout=30):
+    """
+    Get the calling thread's acli session, starting one if needed
+    
+    Args:
+        timeout (int): Maximum time to wait for a new session to start in seconds
+        
+    Returns:
+        AcliSession: The session, or None if sessions are disabled or one could not be started
+    """
+    if not _use_acli_sessions or getattr(_session_state, "failed", False):
+        return None
+    
+    session = getattr(_session_state, "session", None)
+    if session is not None and session.alive:
+        return session
+    
+    try:
+        session = AcliSession(timeout)
     except Exception as e:
-        logger.error("Command failed: {}".format(e))
+        # Do not retry in this thread, each attempt could wait for the full timeout
+        logger.warning("Could not start acli session, falling back to one process per command: {}".format(e))
+        _session_state.failed = True
         return None
+    
+    _session_state.session = session
+    with _open_sessions_lock:
+        _open_sessions.append(session)
+    return session
 
-def get_volume_groups(dry_run=False):
+def close_acli_sessions():
+    """Close all acli sessions started by get_acli_session()"""
+    with _open_sessions_lock:
+        sessions = list(_open_sessions)
+        del _open_sessions[:]
+    for session in sessions:
+        if session.alive:
+            session.close()
+
+def run_acli_command(command, dry_run=False, timeout=30, confirm=False, line_filter=None,
+                     grep_pattern=None, mutating=True):
     """
-    List all volume groups using 'acli vg.list'
+    Execute an ACLI command via subprocess
     
+    Args:
+        command (str): The ACLI command to run
+        dry_run (bool): If True and the command is mutating, only print the
+            command without executing
+        timeout (int): Maximum time to wait for command completion in seconds
+        confirm (bool): Whether to auto-confirm any prompts with 'yes'
+        line_filter (callable): If given, stream the output through this function
+            (see run_process)
+        grep_pattern (str): If given with line_filter, filter the output with grep first
+        mutating (bool): Whether the command changes cluster state. Read-only
+            commands (mutating=False) are executed even in dry run mode.
+        
     Returns:
-        list: List of volume group names
+        str: Command output if executed, or a dry run message
     """
-    output = run_acli_command("vg.list", dry_run)
-    if output is None:
-        logger.error("Failed to retrieve volume groups")
-        return []
+    dry_run = dry_run and mutating
+    
+    # Streamed commands are read from their own process, never from a session
+    session = get_acli_session(timeout) if not dry_run and line_filter is None else None
+    if session is not None:
+        logger.info("Executing in acli session: {}".format(command))
+        return session.send(command, timeout, confirm)
+    
+    return run_process(build_acli_argv(command), dry_run, timeout, confirm, line_filter, grep_pattern)
+
+def run_acli_script(commands, dry_run=False, timeout=30, confirm=False):
+    """
+    Execute several ACLI commands in a single acli process
+    
+    The commands are sent to the thread's acli session if there is one.
+    Otherwise they are written to the stdin of one new 'acli' process, which
+    runs them in order, like 'acli < script'. With confirm, each command is
+    followed by a 'yes' line to answer its confirmation prompt, the same way
+    'yes' is written to stdin for single commands. acli only reports one
+    exit status for the whole script, so callers should check the results.
     
+    Args:
+        commands (list): The ACLI commands to run, in order
+        dry_run (bool): If True, only print the commands without executing
+        timeout (int): Maximum time to wait for each command in seconds
+        confirm (bool): Whether to auto-confirm any prompts with 'yes'
+        
+    Returns:
+        str: Combined command output if executed, or a dry run message
+    """
     if dry_run:
-        # For dry run, we might not have actual output, so return empty list
-        return []
+        for command in commands:
+            logger.info("[DRY RUN] Would execute: acli {}".format(command))
+        return "[DRY RUN] Command not executed"
     
-    # Parse the output to extract VG names
-    vgs = []
-    for line in output.splitlines():
-        # Skip header lines or empty lines
-        if not line.strip() or line.startswith("-") or "Name" in line:
-            continue
+    session = get_acli_session(timeout)
+    if session is not None:
+        outputs = []
+        for command in commands:
+            logger.info("Executing in acli session: {}".format(command))
+            output = session.send(command, timeout, confirm)
+            # A timed out session is closed, so the remaining commands are not sent
+            if output is None or output == "TIMEOUT":
+                return output
+            outputs.append(output)
+        return "".join(outputs)
+    
+    lines = []
+    for command in commands:
+        logger.info("Adding to acli script: {}".format(command))
+        lines.append(command)
+        if confirm:
+            lines.append("yes")
+    
+    return run_process(["acli"], dry_run, timeout * len(commands), stdin_text="\n".join(lines) + "\n")
+
+def get_volume_groups(prefix):
+    """
+    List the volume groups starting with a prefix using 'acli vg.list'
+    
+    The output is filtered by prefix with grep before it reaches Python,
+    so unrelated VGs are never parsed. vg.list is read-only, so this also
+    runs in dry run mode.
+    
+    Args:
+        prefix (str): VG name prefix to match
+        
+    Returns:
+        list: List of matching volume group names, or None if the list
+            could not be retrieved
+    """
+    def parse_line(line):
+        # Skip header lines or empty lines, which grep lets through if the
+        # prefix happens to match them (e.g. "Vol")
+        if (not line.strip() or line.startswith("-") or line.startswith("Volume Group")
+                or "Name" in line):
+            return None
         
         # Extract VG name (assuming it's the first column)
         parts = line.split()
-        if parts:
-            vgs.append(parts[0])
+        return parts[0] if parts else None
+    
+    # Escape ERE metacharacters so the prefix is matched literally
+    pattern = "^" + _ERE_SPECIAL_RE.sub(r"\\\1", prefix)
+    
+    vgs = run_acli_command("vg.list", line_filter=parse_line, grep_pattern=pattern, mutating=False)
+    if vgs is None or vgs == "TIMEOUT":
+        logger.error("Failed to retrieve volume groups")
+        return None
     
     return vgs
 
-def get_vg_vms(vg_name, dry_run=False):
+def get_vg_info(vg_name):
+    """
+    Get the raw 'acli vg.get' output for a volume group
+    
+    The output is fetched once per VG and parsed once by parse_vg_output().
+    vg.get is read-only, so this also runs in dry run mode.
+    
+    Args:
+        vg_name (str): Name of the volume group
+        
+    Returns:
+        str: Command output, or None if unavailable
+    """
+    output = run_acli_command("vg.get {}".format(vg_name), mutating=False)
+    if output is None or output == "TIMEOUT":
+        return None
+    return output
+
+def parse_vg_output(output):
+    """
+    Parse 'acli vg.get' output in a single pass over its lines
+    
+    Tracks whether the current line is inside an attachment_list block, so
+    VM UUIDs are only taken from attachments, while the attachment type and
+    disk indexes are collected from everywhere else.
+    
+    Args:
+        output (str): Output of get_vg_info() for the volume group
+        
+    Returns:
+        VGInfo: Attachment type (or None if absent), VM UUIDs and disk indexes
+    """
+    attachment_type = None
+    vm_uuids = []
+    disk_indexes = []
+    
+    # Brace depth within the current attachment_list block, 0 when outside one
+    attachment_depth = 0
+    
+    for line in output.splitlines():
+        line = line.strip()
+        
+        if attachment_depth:
+            if line.endswith("{"):
+                attachment_depth += 1
+            elif line == "}":
+                attachment_depth -= 1
+            else:
+                vm_match = _VM_UUID_RE.match(line)
+                if vm_match:
+                    vm_uuids.append(vm_match.group(1))
+            continue
+        
+        if line.startswith("attachment_list") and line.endswith("{"):
+            attachment_depth = 1
+            continue
+        
+        index_match = _DISK_INDEX_RE.match(line)
+        if index_match:
+            disk_indexes.append(index_match.group(1))
+            continue
+        
+        if attachment_type is None:
+            attachment_match = _ATTACH_TYPE_RE.match(line)
+            if attachment_match:
+                attachment_type = attachment_match.group(1)
+    
+    return VGInfo(attachment_type, vm_uuids, disk_indexes)
+
+def get_vg_vms(vg_name, vg_info):
     """
     Get list of VMs attached to a volume group
     
     Args:
         vg_name (str): Name of the volume group
-        dry_run (bool): Whether this is a dry run
+        vg_info (VGInfo): Parsed vg.get output for the volume group
         
     Returns:
         list: List of VM UUIDs
     """
-    output = run_acli_command("vg.get {}".format(vg_name), dry_run)
-    if output is None or dry_run:
+    if vg_info is None:
         return []
     
     # Look for volume_group_attachment_type field to determine if VMs are attached
-    attachment_match = re.search(r'volume_group_attachment_type: "([^"]+)"', output)
-    if attachment_match:
-        attachment_type = attachment_match.group(1)
+    attachment_type = vg_info.attachment_type
+    if attachment_type is not None:
         if attachment_type == "kNone":
             # No VMs are attached
             return []
@@ -140,10 +615,9 @@ def get_vg_vms(vg_name, dry_run=False):
     
     # Check for direct attachment VM UUIDs
     vms = []
-    attachment_list_entries = re.findall(r'attachment_list\s*{[^}]*vm_uuid:\s*"([^"]+)"[^}]*}', output, re.DOTALL)
-    if attachment_list_entries:
-        vms.extend(attachment_list_entries)
-        logger.info(f"Found directly attached VMs: {attachment_list_entries}")
+    if vg_info.vm_uuids:
+        vms.extend(vg_info.vm_uuids)
+        logger.info(f"Found directly attached VMs: {vg_info.vm_uuids}")
     
     return vms
 
@@ -182,31 +656,21 @@ def detach_vms(vg_name, vm_uuids, dry_run=False):
     
     return success
 
-def get_vg_disks(vg_name, dry_run=False):
+def get_vg_disks(vg_name, vg_info):
     """
     Get list of disk indexes attached to a volume group
     
     Args:
         vg_name (str): Name of the volume group
-        dry_run (bool): Whether this is a dry run
+        vg_info (VGInfo): Parsed vg.get output for the volume group
         
     Returns:
         list: List of disk indexes
     """
-    output = run_acli_command("vg.get {}".format(vg_name), dry_run)
-    if output is None or dry_run:
+    if vg_info is None:
         return []
     
-    # Parse the output to extract disk indexes
-    disks = []
-    
-    # Using regex to find all disk index entries
-    # Look for index: X in disk_list sections
-    index_matches = re.findall(r'index: (\d+)', output)
-    if index_matches:
-        disks.extend(index_matches)
-    
-    return disks
+    return list(vg_info.disk_indexes)
 
 def detach_disks(vg_name, disk_indexes, dry_run=False):
     """
@@ -224,50 +688,158 @@ def detach_disks(vg_name, disk_indexes, dry_run=False):
         logger.info("No disks to detach from {}".format(vg_name))
         return True
     
-    success = True
-    for disk_index in disk_indexes:
-        # Use a shorter timeout for disk deletion as it's often an async operation
-        # Add confirm=True to automatically answer 'yes' to confirmation prompts
-        result = run_acli_command("vg.disk_delete {} {}".format(vg_name, disk_index), 
-                                 dry_run, timeout=20, confirm=True)
-        
-        # Consider TIMEOUT as a success since the operation was likely submitted
-        if result is None and not dry_run:
-            logger.error("Failed to detach disk index {} from {}".format(disk_index, vg_name))
-            success = False
-        elif result == "TIMEOUT" and not dry_run:
-            logger.warning("Disk deletion command timed out for disk {} in {}. The operation may still be in progress.".format(
-                disk_index, vg_name))
-            # Consider timeout as success and continue with next operations
+    # Delete all disks in a single acli process instead of one per disk.
+    # Use a shorter timeout per disk as disk deletion is often an async operation
+    # Add confirm=True to automatically answer 'yes' to confirmation prompts
+    commands = ["vg.disk_delete {} {}".format(vg_name, disk_index) for disk_index in disk_indexes]
+    result = run_acli_script(commands, dry_run, timeout=20, confirm=True)
     
-    return success
+    if dry_run:
+        return True
+    
+    # acli only reports one exit status for the script, so check which disks are left
+    output = get_vg_info(vg_name)
+    if output is None:
+        # Cannot verify, so rely on the script's exit status alone
+        if result is None:
+            logger.error("Failed to detach disk indexes {} from {}".format(", ".join(disk_indexes), vg_name))
+            return False
+        if result == "TIMEOUT":
+            logger.warning("Disk deletion commands timed out for disks {} in {}. The operations may still be in progress.".format(
+                ", ".join(disk_indexes), vg_name))
+        return True
+    
+    remaining_disks = set(parse_vg_output(output).disk_indexes)
+    failed_disks = [disk_index for disk_index in disk_indexes if disk_index in remaining_disks]
+    if failed_disks:
+        logger.error("Failed to detach disk indexes {} from {}{}".format(
+            ", ".join(failed_disks), vg_name,
+            " (the commands timed out and may still be in progress)" if result == "TIMEOUT" else ""))
+        return False
+    
+    return True
 
-def delete_vg(vg_name, dry_run=False):
+def delete_vgs(vg_names, prefix, dry_run=False):
     """
-    Delete a volume group
+    Delete volume groups using a few acli processes
+    
+    The vg.delete commands are split into chunks of _VG_DELETE_CHUNK_SIZE,
+    and each chunk runs as one acli script. A chunk's deadline is 20 seconds
+    per command, so a hung vg.delete stalls the run for at most one chunk's
+    deadline. Only the rest of that chunk is lost; later chunks still run.
+    
+    As acli only reports one exit status per script, and a timed out script
+    may have stopped partway, the VG list is fetched again afterwards to
+    find out which VGs were actually deleted.
+    
+    Must only be called once no worker threads are using acli sessions,
+    as it closes all sessions before that check.
     
     Args:
-        vg_name (str): Name of the volume group to delete
+        vg_names (list): Names of the volume groups to delete
+        prefix (str): VG name prefix the volume groups were selected with
         dry_run (bool): Whether this is a dry run
         
     Returns:
-        bool: True if successful, False otherwise
+        list: Names of the volume groups that were deleted
     """
-    # Add confirm=True to automatically answer 'yes' to confirmation prompts
-    result = run_acli_command("vg.delete {}".format(vg_name), dry_run, timeout=20, confirm=True)
+    if not vg_names:
+        return []
     
-    # Consider TIMEOUT as a success as the operation was likely submitted
-    success = result is not None or result == "TIMEOUT" or dry_run
+    # VGs whose chunk finished with a zero exit status, used if the VG list
+    # cannot be fetched for verification
+    submitted = []
+    timed_out = False
+    for start in range(0, len(vg_names), _VG_DELETE_CHUNK_SIZE):
+        chunk = vg_names[start:start + _VG_DELETE_CHUNK_SIZE]
+        # Add confirm=True to automatically answer 'yes' to confirmation prompts
+        commands = ["vg.delete {}".format(vg_name) for vg_name in chunk]
+        result = run_acli_script(commands, dry_run, timeout=20, confirm=True)
+        if result == "TIMEOUT":
+            timed_out = True
+        elif result is not None:
+            submitted.extend(chunk)
     
-    if success:
-        if dry_run:
+    if dry_run:
+        for vg_name in vg_names:
             logger.info("[DRY RUN] Would delete volume group: {}".format(vg_name))
-        else:
-            logger.info("Deleted volume group: {}".format(vg_name))
+        return list(vg_names)
+    
+    # After a timeout the acli process was killed partway, so the commands after
+    # the one that hung never ran. Check the VG list in every case.
+    if timed_out:
+        logger.warning("Volume group deletion timed out. Checking which volume groups were deleted.")
+    
+    # delete_vgs() runs on the main thread once the workers are done, so the
+    # only open session is this thread's; close it before running vg.list
+    close_acli_sessions()
+    remaining_vgs = get_volume_groups(prefix)
+    if remaining_vgs is None:
+        # Cannot verify, so rely on each chunk's exit status alone
+        if timed_out:
+            logger.error("Unable to verify volume group deletion after the timeout")
+        deleted = submitted
     else:
-        logger.error("Failed to delete volume group: {}".format(vg_name))
+        remaining_vgs = set(remaining_vgs)
+        deleted = [vg_name for vg_name in vg_names if vg_name not in remaining_vgs]
     
-    return success
+    deleted_set = set(deleted)
+    for vg_name in vg_names:
+        if vg_name in deleted_set:
+            logger.info("Deleted volume group: {}".format(vg_name))
+        else:
+            logger.error("Failed to delete volume group: {}".format(vg_name))
+    
+    return deleted
+
+def process_vg(vg_name, args):
+    """
+    Check a single volume group and detach its VMs and disks
+    
+    The VG itself is not deleted here; all ready VGs are deleted together
+    by delete_vgs() once every VG has been processed.
+    
+    Args:
+        vg_name (str): Name of the volume group
+        args (argparse.Namespace): Parsed command line arguments
+        
+    Returns:
+        tuple: (ready, vg_name) where ready is True if the VG can be deleted
+    """
+    logger.info("Processing volume group: {}".format(vg_name))
+    
+    # Fetch and parse the VG details once for both the VM and disk checks.
+    # Dry runs use the same read-only queries as live runs.
+    output = get_vg_info(vg_name)
+    vg_info = parse_vg_output(output) if output else None
+    
+    # Check for attached VMs
+    attached_vms = get_vg_vms(vg_name, vg_info)
+    
+    # If VMs are attached
+    if attached_vms:
+        if args.force:
+            logger.warning("VMs are attached to {}: {}. Continuing with detachment due to --force flag".format(
+                vg_name, ", ".join(attached_vms)))
+            # Detach VMs first
+            if not detach_vms(vg_name, attached_vms, args.dry_run):
+                logger.error("Failed to detach VMs from {}. Skipping VG deletion.".format(vg_name))
+                return False, vg_name
+        else:
+            logger.warning("VMs are attached to {}: {}. Skipping (use --force to override)".format(
+                vg_name, ", ".join(attached_vms)))
+            return False, vg_name
+    
+    # Get disks attached to the VG
+    disk_indexes = get_vg_disks(vg_name, vg_info)
+    logger.info("Found {} disks attached to {}".format(len(disk_indexes), vg_name))
+    
+    # Detach disks
+    if not detach_disks(vg_name, disk_indexes, args.dry_run):
+        logger.error("Skipping deletion of {} due to disk detachment failure".format(vg_name))
+        return False, vg_name
+    
+    return True, vg_name
 
 def main():
     parser = argparse.ArgumentParser(description="Clean up Nutanix Volume Groups with a specified prefix")
@@ -276,8 +848,21 @@ def main():
     parser.add_argument("--force", action="store_true", help="Force deletion even if VMs are attached (USE WITH CAUTION)")
     parser.add_argument("--prefix", required=True, help="VG name prefix to match")
     parser.add_argument("--timeout", type=int, default=30, help="Command timeout in seconds (default: 30)")
+    parser.add_argument("--parallel", type=int, default=8, help="Number of VGs to process in parallel (default: 8)")
+    parser.add_argument("--max-concurrent-acli", type=int, default=16,
+                        help="Maximum number of acli commands running at once (default: 16)")
+    parser.add_argument("--session", action="store_true",
+                        help="Reuse one persistent acli process per worker instead of one per command. "
+                             "Each session stays open while its worker is idle, so --parallel is capped "
+                             "at --max-concurrent-acli. Disk and VG deletions are still verified, but "
+                             "vg.detach_from_vm and vg.get failures other than timeouts are not detected")
     args = parser.parse_args()
     
+    if args.parallel < 1:
+        parser.error("--parallel must be at least 1")
+    if args.max_concurrent_acli < 1:
+        parser.error("--max-concurrent-acli must be at least 1")
+    
     if args.verbose:
         logger.setLevel(logging.DEBUG)
     
@@ -293,40 +878,31 @@ def main():
     logger.info("Targeting VGs with prefix: {}".format(args.prefix))
     logger.info("Command timeout set to {} seconds".format(args.timeout))
     
-    # Get list of all volume groups
-    logger.info("Retrieving list of volume groups...")
-    vgs = get_volume_groups(args.dry_run)
+    logger.info("Running at most {} acli commands at once".format(args.max_concurrent_acli))
+    set_max_concurrent_acli(args.max_concurrent_acli)
     
-    if args.dry_run:
-        # For dry run, parse output from acli vg.list command if possible
-        # Try to execute the command just to see the output, but don't rely on the result
-        try:
-            output = run_acli_command("vg.list", dry_run=False)
-            if output:
-                # Parse the real VGs from the output even in dry run mode
-                vgs = []
-                for line in output.splitlines():
-                    parts = line.split()
-                    if parts and not line.startswith("Volume Group") and not line.startswith("-"):
-                        vgs.append(parts[0])
-            else:
-                # Fallback to simulated data if we can't get real data
-                logger.info("[DRY RUN] Using simulated VG list for demonstration")
-                vgs = ["EXAMPLE_VG1", "EXAMPLE_VG2", "OTHER_VG", "ANOTHER_VG"]
-        except Exception as e:
-            # Fallback to simulated data if command fails
-            logger.info("[DRY RUN] Using simulated VG list for demonstration")
-            vgs = ["EXAMPLE_VG1", "EXAMPLE_VG2", "OTHER_VG", "ANOTHER_VG"]
+    if args.session:
+        # Every worker keeps its session process open between commands, so the
+        # number of workers is what bounds the number of open acli processes
+        if args.parallel > args.max_concurrent_acli:
+            logger.warning("Limiting --parallel from {} to {} so open acli sessions stay within "
+                           "--max-concurrent-acli".format(args.parallel, args.max_concurrent_acli))
+            args.parallel = args.max_concurrent_acli
+        logger.info("Using persistent acli sessions (one per worker)")
+        enable_acli_sessions()
     
-    if not vgs:
+    # Get list of the volume groups matching the prefix
+    logger.info("Retrieving list of volume groups...")
+    target_vgs = get_volume_groups(args.prefix)
+    
+    if target_vgs is None:
         if not args.dry_run:
-            logger.info("No volume groups found or unable to retrieve the list")
+            logger.info("Unable to retrieve the list of volume groups")
             return
-    
-    logger.info("Found {} volume groups".format(len(vgs)))
-    
-    # Filter for volume groups that start with the specified prefix
-    target_vgs = [vg for vg in vgs if vg.startswith(args.prefix)]
+        # Fallback to simulated data if we can't get real data
+        logger.info("[DRY RUN] Using simulated VG list for demonstration")
+        simulated_vgs = ["EXAMPLE_VG1", "EXAMPLE_VG2", "OTHER_VG", "ANOTHER_VG"]
+        target_vgs = [vg for vg in simulated_vgs if vg.startswith(args.prefix)]
     
     if not target_vgs:
         logger.info("No volume groups found matching the pattern '{}'".format(args.prefix))
@@ -334,86 +910,44 @@ def main():
     
     logger.info("Found {} volume groups matching the pattern '{}'".format(len(target_vgs), args.prefix))
     
-    # Process each target volume group
-    success_count = 0
+    # Process the target volume groups concurrently. Each VG is independent and the
+    # work is dominated by blocking acli subprocesses, so threads are sufficient.
+    ready_vgs = []
     failure_count = 0
     
-    for vg_name in target_vgs:
-        logger.info("Processing volume group: {}".format(vg_name))
-        
-        # Check for attached VMs
-        if args.dry_run:
-            logger.info("[DRY RUN] Would check for VMs attached to {}".format(vg_name))
-            # Try to get actual VM attachment information even in dry run mode
-            try:
-                output = run_acli_command("vg.get {}".format(vg_name), dry_run=False)
-                if output:
-                    # Check attachment type
-                    attachment_match = re.search(r'volume_group_attachment_type: "([^"]+)"', output)
-                    if attachment_match and attachment_match.group(1) != "kNone":
-                        # Look for attached VMs
-                        vm_uuids = re.findall(r'attachment_list\s*{[^}]*vm_uuid:\s*"([^"]+)"[^}]*}', output, re.DOTALL)
-                        if vm_uuids:
-                            logger.info("[DRY RUN] Found VMs attached to {}: {}".format(vg_name, ", ".join(vm_uuids)))
-                            attached_vms = vm_uuids
-                        else:
-                            attached_vms = []
-                    else:
-                        attached_vms = []
+    logger.info("Processing volume groups with up to {} parallel workers".format(args.parallel))
+    try:
+        with ThreadPoolExecutor(max_workers=args.parallel) as executor:
+            futures = {executor.submit(process_vg, vg_name, args): vg_name for vg_name in target_vgs}
+            # Collect results as each VG finishes so a slow VG does not hold up the others
+            for future in as_completed(futures):
+                vg_name = futures[future]
+                try:
+                    ready, _ = future.result()
+                except Exception:
+                    logger.exception("Unexpected error while processing volume group: {}".format(vg_name))
+                    ready = False
+            
+                if ready:
+                    ready_vgs.append(vg_name)
                 else:
-                    attached_vms = []
-            except Exception:
-                attached_vms = []
-        else:
-            attached_vms = get_vg_vms(vg_name, args.dry_run)
-        
-        # If VMs are attached
-        if attached_vms:
-            if args.force:
-                logger.warning("VMs are attached to {}: {}. Continuing with detachment due to --force flag".format(
-                    vg_name, ", ".join(attached_vms)))
-                # Detach VMs first
-                if not detach_vms(vg_name, attached_vms, args.dry_run):
-                    logger.error("Failed to detach VMs from {}. Skipping VG deletion.".format(vg_name))
                     failure_count += 1
-                    continue
-            else:
-                logger.warning("VMs are attached to {}: {}. Skipping (use --force to override)".format(
-                    vg_name, ", ".join(attached_vms)))
-                failure_count += 1
-                continue
-        
-        # Get disks attached to the VG
-        if args.dry_run:
-            logger.info("[DRY RUN] Would check for disks in {}".format(vg_name))
-            # Try to get actual disk information even in dry run mode for better simulation
-            try:
-                output = run_acli_command("vg.get {}".format(vg_name), dry_run=False)
-                if output:
-                    disk_indexes = []
-                    # Using regex to find all disk index entries
-                    index_matches = re.findall(r'index: (\d+)', output)
-                    if index_matches:
-                        disk_indexes = index_matches
-                    logger.info("[DRY RUN] Found {} disks in {}".format(len(disk_indexes), vg_name))
-                else:
-                    disk_indexes = ["0"]  # Default to one disk with index 0
-            except Exception:
-                disk_indexes = ["0"]  # Default to one disk with index 0
-        else:
-            disk_indexes = get_vg_disks(vg_name, args.dry_run)
-            logger.info("Found {} disks attached to {}".format(len(disk_indexes), vg_name))
-        
-        # Detach disks
-        if detach_disks(vg_name, disk_indexes, args.dry_run):
-            # Delete the VG
-            if delete_vg(vg_name, args.dry_run):
-                success_count += 1
-            else:
-                failure_count += 1
-        else:
-            logger.error("Skipping deletion of {} due to disk detachment failure".format(vg_name))
-            failure_count += 1
+    finally:
+        # The workers are done, so their idle sessions must not stay open
+        # alongside the acli processes of the delete phase
+        close_acli_sessions()
+    
+    # Delete all VGs whose disks were detached, in chunked acli invocations
+    if ready_vgs:
+        logger.info("Deleting {} volume groups".format(len(ready_vgs)))
+    try:
+        deleted_vgs = delete_vgs(ready_vgs, args.prefix, args.dry_run)
+    finally:
+        # Close the session the main thread may have started for the deletes
+        close_acli_sessions()
+    
+    success_count = len(deleted_vgs)
+    failure_count += len(ready_vgs) - len(deleted_vgs)
     
     # Summary
     logger.info("=" * 50)